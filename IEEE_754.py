@@ -13,12 +13,98 @@ Format: [Sign][Exponent][Mantissa]
 Value = (-1)^sign x 2^(exponent-127) x (1.mantissa)
 """
 
+import string
 import struct
+import sys
+
+# Precompiled packer for converting between floats and float32 bytes
+_F = struct.Struct('!f')
+
+# Bound up front so hex_to_float skips the attribute lookups per call
+_HEX_DIGITS = string.hexdigits
+_fromhex = bytes.fromhex
+_unpack_float = _F.unpack
+
+# Field layout of the 32-bit word
+_SIGN_SHIFT = 31
+_MANT_BITS = 23
+_MANT_MASK = 0x7FFFFF
+_EXP_MASK = 0xFF
+_EXP_INF = 0xFF  # Exponent of Infinity and NaN
+_EXP_ZERO = 0    # Exponent of Zero and Denormalized
+_BIAS = 127
+
+# Separator lines used in the printed output
+_BANNER = "=" * 70
+_EXP_RULE = "─" * 8
+_MANT_RULE = "─" * 23
+
+
+def _float_to_word(value):
+    """
+    Get the 32-bit pattern of a float as an unsigned integer.
+    
+    Args:
+        value: Float to reinterpret as single precision
+    
+    Returns:
+        Integer in the range [0, 2^32)
+    """
+    # Pack as single precision float, read the 4 bytes as an unsigned int
+    return int.from_bytes(_F.pack(value), 'big')
+
+
+# Codes returned by IEEE754SinglePrecision.is_special_batch, indexed by code
+SPECIAL_KINDS = ("Zero", "Denormalized", "Infinity", "NaN", None)
+
+# is_special() results indexed by exponent class * 2 + (mantissa != 0)
+_SPECIAL_LOOKUP = (None, None, "Zero", "Denormalized", "Infinity", "NaN")
+_SPECIAL_CODES = (4, 4, 0, 1, 2, 3)
+
+# Numba kernel for batch classification, compiled on first use
+_classify_kernel = None
+
+
+def _get_classify_kernel():
+    """
+    Compile (once) and return the Numba classification kernel.
+    
+    Returns:
+        Function mapping a uint32 array to an int8 array of codes
+    """
+    global _classify_kernel
+    if _classify_kernel is None:
+        import numpy as np
+        from numba import njit, prange
+        
+        codes = np.array(_SPECIAL_CODES, dtype=np.int8)
+        
+        @njit(parallel=True)
+        def classify(words):
+            out = np.empty(words.shape, np.int8)
+            for i in prange(words.size):
+                exponent_raw = (words[i] >> _MANT_BITS) & _EXP_MASK
+                has_mantissa = (words[i] & _MANT_MASK) != 0
+                row = ((exponent_raw == _EXP_INF) * 2
+                       + (exponent_raw == _EXP_ZERO))
+                out[i] = codes[row * 2 + has_mantissa]
+            return out
+        
+        _classify_kernel = classify
+    return _classify_kernel
 
 
 class IEEE754SinglePrecision:
     """Class to represent and analyze IEEE 754 single precision floats."""
     
+    # Only the input and its bit pattern are stored; everything else is derived.
+    # Accessors decode fields from _word with the module-level layout
+    # constants (_SIGN_SHIFT, _MANT_BITS, ...); keep them integer-only.
+    __slots__ = ('value', '_word')
+    
+    # Weight of the least significant mantissa bit (2^-23)
+    _MANTISSA_SCALE = 1.0 / (1 << _MANT_BITS)
+    
     def __init__(self, value):
         """
         Initialize with a float value.
@@ -27,42 +113,53 @@ class IEEE754SinglePrecision:
             value: Float number to represent
         """
         self.value = value
-        self.binary_representation = self._get_binary_representation()
-        self.sign_bit = self.binary_representation[0]
-        self.exponent_bits = self.binary_representation[1:9]
-        self.mantissa_bits = self.binary_representation[9:32]
+        self._word = _float_to_word(value)
     
-    def _get_binary_representation(self):
-        """
-        Get 32-bit binary representation of the float.
-        
-        Returns:
-            String of 32 binary digits
-        """
-        # Pack as single precision float, unpack as unsigned int
-        packed = struct.pack('!f', self.value)
-        as_int = struct.unpack('!I', packed)[0]
-        
-        # Convert to 32-bit binary string
-        binary = format(as_int, '032b')
-        return binary
+    # Binary strings are only needed for display, so build them on access.
+    # OR-ing in a bit above the field fixes the width; bin() output is then
+    # sliced past the '0b1' prefix.
+    
+    @property
+    def binary_representation(self):
+        """String of 32 binary digits."""
+        return bin(self._word | (1 << 32))[3:]
+    
+    @property
+    def sign_bit(self):
+        """Sign bit as a 1-character string."""
+        return str(self._word >> _SIGN_SHIFT)
+    
+    @property
+    def exponent_bits(self):
+        """Exponent field as an 8-character binary string."""
+        exponent_raw = (self._word >> _MANT_BITS) & _EXP_MASK
+        return bin(exponent_raw | (_EXP_MASK + 1))[3:]
+    
+    @property
+    def mantissa_bits(self):
+        """Mantissa field as a 23-character binary string."""
+        return bin((self._word & _MANT_MASK) | (_MANT_MASK + 1))[3:]
     
     def get_sign(self):
         """Get the sign of the number."""
-        return int(self.sign_bit)
+        return self._word >> _SIGN_SHIFT
     
     def get_exponent_raw(self):
         """Get raw exponent value (biased)."""
-        return int(self.exponent_bits, 2)
+        return (self._word >> _MANT_BITS) & _EXP_MASK
     
     def get_exponent_unbiased(self):
         """Get unbiased exponent (subtract 127)."""
-        return self.get_exponent_raw() - 127
+        return self.get_exponent_raw() - _BIAS
     
     def get_mantissa(self):
         """Get mantissa as binary string."""
         return self.mantissa_bits
     
+    def hex_representation(self):
+        """Get the 32-bit pattern as an 8-digit hexadecimal string."""
+        return f"0x{self._word:08x}"
+    
     def get_mantissa_value(self):
         """
         Calculate actual mantissa value (1.fraction).
@@ -70,109 +167,169 @@ class IEEE754SinglePrecision:
         Returns:
             Float value of mantissa
         """
-        fraction = 0.0
-        for i, bit in enumerate(self.mantissa_bits):
-            if bit == '1':
-                fraction += 2 ** (-(i + 1))
-        return 1.0 + fraction
+        # Fraction bits read as an integer, scaled by 2^-23
+        return 1.0 + (self._word & _MANT_MASK) * self._MANTISSA_SCALE
     
     def is_special(self):
         """Check if number is special (NaN, Infinity, Zero, Denormalized)."""
         exponent_raw = self.get_exponent_raw()
-        mantissa_int = int(self.mantissa_bits, 2)
-        
-        if exponent_raw == 255:
-            if mantissa_int == 0:
-                return "Infinity"
-            else:
-                return "NaN"
-        elif exponent_raw == 0:
-            if mantissa_int == 0:
-                return "Zero"
-            else:
-                return "Denormalized"
-        return None
+        has_mantissa = (self._word & _MANT_MASK) != 0
+        
+        # Branchless lookup: row 0 = normal, 1 = exponent all 0s, 2 = all 1s
+        row = (exponent_raw == _EXP_INF) * 2 + (exponent_raw == _EXP_ZERO)
+        return _SPECIAL_LOOKUP[row * 2 + has_mantissa]
+    
+    @staticmethod
+    def analyze_batch(values):
+        """
+        Decode many floats at once using NumPy.
+        
+        Args:
+            values: Sequence or array of numbers, converted to float32
+        
+        Returns:
+            Tuple of uint32 arrays (sign, exponent_raw, mantissa)
+        """
+        import numpy as np
+        
+        # Reinterpret the float32 buffer as uint32 without copying
+        words = np.asarray(values, dtype=np.float32).view(np.uint32)
+        return (
+            words >> _SIGN_SHIFT,
+            (words >> _MANT_BITS) & _EXP_MASK,
+            words & _MANT_MASK,
+        )
+    
+    @staticmethod
+    def analyze_batch_gpu(values):
+        """
+        Decode many floats at once on the GPU using CuPy.
+        
+        Only worthwhile for large arrays, where the host-device
+        transfer is outweighed by the decoding work.
+        
+        Args:
+            values: Sequence or array of numbers, converted to float32
+        
+        Returns:
+            Tuple of host (NumPy) uint32 arrays (sign, exponent_raw, mantissa)
+        """
+        import cupy as cp
+        
+        # Same reinterpretation as analyze_batch, done on the device
+        words = cp.asarray(values, dtype=cp.float32).view(cp.uint32)
+        return (
+            (words >> _SIGN_SHIFT).get(),
+            ((words >> _MANT_BITS) & _EXP_MASK).get(),
+            (words & _MANT_MASK).get(),
+        )
+    
+    @staticmethod
+    def is_special_batch(values):
+        """
+        Classify many floats at once using a Numba kernel.
+        
+        Args:
+            values: Sequence or array of numbers, converted to float32
+        
+        Returns:
+            int8 array of codes; SPECIAL_KINDS[code] gives the same
+            result as is_special() for each value
+        """
+        import numpy as np
+        
+        # Keep the input's shape (including 0-d) like analyze_batch does
+        words = np.asarray(values, dtype=np.float32).view(np.uint32)
+        codes = _get_classify_kernel()(np.ascontiguousarray(words).ravel())
+        return codes.reshape(words.shape)
     
     def display(self):
         """Display detailed information about the float representation."""
-        print("=" * 70)
-        print(f"IEEE 754 Single Precision Analysis")
-        print("=" * 70)
-        print(f"Decimal Value: {self.value}")
-        print()
+        parts = [
+            _BANNER,
+            "IEEE 754 Single Precision Analysis",
+            _BANNER,
+            f"Decimal Value: {self.value}",
+            "",
+        ]
         
         # Binary representation
-        print("Binary Representation (32 bits):")
-        print(f"  {self.sign_bit} | {self.exponent_bits} | {self.mantissa_bits}")
-        print(f"  ↑   ↑{'─' * 8}↑   ↑{'─' * 23}↑")
-        print(f"  │   Exponent(8)   Mantissa(23)")
-        print(f"  Sign")
-        print()
+        parts += [
+            "Binary Representation (32 bits):",
+            f"  {self.sign_bit} | {self.exponent_bits} | {self.mantissa_bits}",
+            f"  ↑   ↑{_EXP_RULE}↑   ↑{_MANT_RULE}↑",
+            "  │   Exponent(8)   Mantissa(23)",
+            "  Sign",
+            "",
+        ]
         
         # Check for special values
         special = self.is_special()
         if special:
-            print(f"Special Value: {special}")
+            parts.append(f"Special Value: {special}")
             if special == "Infinity":
                 sign = "Negative" if self.get_sign() == 1 else "Positive"
-                print(f"   {sign} Infinity")
+                parts.append(f"   {sign} Infinity")
             elif special == "Zero":
                 sign = "-" if self.get_sign() == 1 else "+"
-                print(f"   {sign}0.0")
-            print("=" * 70)
+                parts.append(f"   {sign}0.0")
+            parts.append(_BANNER)
+            sys.stdout.write("\n".join(parts) + "\n")
             return
         
         # Sign
         sign = self.get_sign()
         sign_str = "Negative (-)" if sign == 1 else "Positive (+)"
-        print(f"Sign Bit: {sign}")
-        print(f"  → {sign_str}")
-        print()
+        parts += [
+            f"Sign Bit: {sign}",
+            f"  → {sign_str}",
+            "",
+        ]
         
         # Exponent
         exp_raw = self.get_exponent_raw()
-        exp_unbiased = self.get_exponent_unbiased()
-        print(f"Exponent (8 bits): {self.exponent_bits}")
-        print(f"  → Raw value: {exp_raw}")
-        print(f"  → Unbiased (subtract 127): {exp_raw} - 127 = {exp_unbiased}")
-        print(f"  → Power of 2: 2^{exp_unbiased} = {2**exp_unbiased}")
-        print()
+        exp_unbiased = exp_raw - _BIAS
+        power = 2 ** exp_unbiased
+        parts += [
+            f"Exponent (8 bits): {self.exponent_bits}",
+            f"  → Raw value: {exp_raw}",
+            f"  → Unbiased (subtract 127): {exp_raw} - 127 = {exp_unbiased}",
+            f"  → Power of 2: 2^{exp_unbiased} = {power}",
+            "",
+        ]
         
         # Mantissa
         mantissa_val = self.get_mantissa_value()
-        print(f"Mantissa (23 bits): {self.mantissa_bits}")
-        print(f"  → Implicit leading 1: 1.{self.mantissa_bits}")
-        print(f"  → Decimal value: {mantissa_val:.10f}")
-        print()
+        parts += [
+            f"Mantissa (23 bits): {self.mantissa_bits}",
+            f"  → Implicit leading 1: 1.{self.mantissa_bits}",
+            f"  → Decimal value: {mantissa_val:.10f}",
+            "",
+        ]
         
         # Final calculation
         sign_multiplier = -1 if sign == 1 else 1
-        calculated = sign_multiplier * (2 ** exp_unbiased) * mantissa_val
+        calculated = sign_multiplier * power * mantissa_val
         
-        print("Final Calculation:")
-        print(f"  Value = (-1)^sign x 2^exponent x mantissa")
-        print(f"  Value = (-1)^{sign} x 2^{exp_unbiased} x {mantissa_val:.10f}")
-        print(f"  Value = {sign_multiplier} x {2**exp_unbiased} x {mantissa_val:.10f}")
-        print(f"  Value = {calculated}")
-        print()
+        parts += [
+            "Final Calculation:",
+            "  Value = (-1)^sign x 2^exponent x mantissa",
+            f"  Value = (-1)^{sign} x 2^{exp_unbiased} x {mantissa_val:.10f}",
+            f"  Value = {sign_multiplier} x {power} x {mantissa_val:.10f}",
+            f"  Value = {calculated}",
+            "",
+        ]
         
         # Hexadecimal
-        hex_rep = hex(int(self.binary_representation, 2))
-        print(f"Hexadecimal: {hex_rep}")
-        print("=" * 70)
+        parts += [
+            f"Hexadecimal: {self.hex_representation()}",
+            _BANNER,
+        ]
+        sys.stdout.write("\n".join(parts) + "\n")
 
 
-def float_to_ieee754(value):
-    """
-    Convert float to IEEE 754 representation.
-    
-    Args:
-        value: Float to convert
-    
-    Returns:
-        IEEE754SinglePrecision object
-    """
-    return IEEE754SinglePrecision(value)
+# Convert float to IEEE 754 representation (alias avoids an extra call frame)
+float_to_ieee754 = IEEE754SinglePrecision
 
 
 def binary_to_float(binary_str):
@@ -191,11 +348,8 @@ def binary_to_float(binary_str):
     # Convert binary to integer
     as_int = int(binary_str, 2)
     
-    # Pack as unsigned int, unpack as float
-    packed = struct.pack('!I', as_int)
-    value = struct.unpack('!f', packed)[0]
-    
-    return value
+    # Read the 4 big-endian bytes back as a float
+    return _F.unpack_from(as_int.to_bytes(4, 'big'))[0]
 
 
 def hex_to_float(hex_str):
@@ -209,25 +363,37 @@ def hex_to_float(hex_str):
         Float value
     """
     # Remove 0x prefix if present
-    if hex_str.startswith('0x') or hex_str.startswith('0X'):
+    if hex_str[:2] in ('0x', '0X'):
         hex_str = hex_str[2:]
     
-    # Convert hex to integer
-    as_int = int(hex_str, 16)
+    # Validate before padding so errors refer to the digits as typed;
+    # stripping every hex digit leaves only the invalid characters
+    if hex_str.strip(_HEX_DIGITS):
+        raise ValueError(f"Invalid hexadecimal string: {hex_str!r}")
     
-    # Pack as unsigned int, unpack as float
-    packed = struct.pack('!I', as_int)
-    value = struct.unpack('!f', packed)[0]
+    # Full 8-digit input (the common case) needs no padding
+    if len(hex_str) != 8:
+        if not hex_str:
+            raise ValueError("Hexadecimal string must not be empty")
+        
+        # Leading zeros do not change the value
+        if len(hex_str) > 8:
+            hex_str = hex_str.lstrip('0')
+            if len(hex_str) > 8:
+                raise ValueError("Hexadecimal string must be at most 8 digits")
+        
+        hex_str = hex_str.zfill(8)
     
-    return value
+    # Read the 4 bytes directly as a float
+    return _unpack_float(_fromhex(hex_str))[0]
 
 
 def interactive_menu():
     """Interactive menu for IEEE 754 analysis."""
     
-    print("\n" + "=" * 70)
+    print("\n" + _BANNER)
     print("IEEE 754 Single Precision Floating-Point Analyzer")
-    print("=" * 70)
+    print(_BANNER)
     
     while True:
         print("\nOptions:")
@@ -284,9 +450,11 @@ def interactive_menu():
 
 def show_special_values():
     """Display special IEEE 754 values."""
-    print("\n" + "=" * 70)
-    print("Special IEEE 754 Values")
-    print("=" * 70)
+    parts = [
+        "\n" + _BANNER,
+        "Special IEEE 754 Values",
+        _BANNER,
+    ]
     
     special_values = [
         ("Zero", 0.0),
@@ -297,17 +465,22 @@ def show_special_values():
     ]
     
     for name, value in special_values:
-        print(f"\n{name}:")
         ieee = float_to_ieee754(value)
-        print(f"  Binary: {ieee.binary_representation}")
-        print(f"  Parts: {ieee.sign_bit} | {ieee.exponent_bits} | {ieee.mantissa_bits}")
+        parts += [
+            f"\n{name}:",
+            f"  Binary: {ieee.binary_representation}",
+            f"  Parts: {ieee.sign_bit} | {ieee.exponent_bits} | {ieee.mantissa_bits}",
+        ]
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def show_common_examples():
     """Show common example values."""
-    print("\n" + "=" * 70)
-    print("Common Examples")
-    print("=" * 70)
+    parts = [
+        "\n" + _BANNER,
+        "Common Examples",
+        _BANNER,
+    ]
     
     examples = [
         1.0,
@@ -319,11 +492,15 @@ def show_common_examples():
         123.456
     ]
     
+    # Only the bit pattern is shown, so skip building full objects
     for value in examples:
-        print(f"\n{value}:")
-        ieee = float_to_ieee754(value)
-        print(f"  Binary: {ieee.binary_representation}")
-        print(f"  Hex: {hex(int(ieee.binary_representation, 2))}")
+        word = _float_to_word(value)
+        parts += [
+            f"\n{value}:",
+            f"  Binary: {word:032b}",
+            f"  Hex: 0x{word:08x}",
+        ]
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def main():